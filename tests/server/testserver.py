@@ -1,18 +1,34 @@
 # pylint: disable="missing-class-docstring", "missing-function-docstring"
 import datetime
+import os
+from collections import defaultdict
+from dataclasses import dataclass, replace
 from enum import Enum
+from itertools import count
 from sys import float_info
-from typing import Dict, List, Optional, Union
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from uuid import uuid4
 
+import orjson
 from fastapi import FastAPI, Header, HTTPException, Path, Query, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 API_KEY = "OpenApiLibCore"
 API_KEY_NAME = "api_key"
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 REMOVE_ME: str = uuid4().hex
@@ -89,9 +105,47 @@ class EmployeeUpdate(BaseModel):
     parttime_day: Optional[WeekDay] = None
 
 
+# Storage for EmployeeDetails; slotted and serialized natively by orjson.
+@dataclass
+class EmployeeRecord:
+    __slots__ = (
+        "identification",
+        "name",
+        "employee_number",
+        "wagegroup_id",
+        "date_of_birth",
+        "parttime_day",
+    )
+    identification: str
+    name: str
+    employee_number: int
+    wagegroup_id: str
+    date_of_birth: datetime.date
+    parttime_day: Optional[WeekDay]
+
+
+def generate_ids(batch_size: int = 4096) -> Iterator[str]:
+    # one os.urandom call per batch instead of one per uuid4
+    while True:
+        random_bytes = os.urandom(16 * batch_size)
+        for offset in range(0, len(random_bytes), 16):
+            yield random_bytes[offset : offset + 16].hex()
+
+
+def json_array_response(json_items: Iterable[bytes]) -> Response:
+    return Response(
+        content=b"[%s]" % b",".join(json_items), media_type="application/json"
+    )
+
+
 WAGE_GROUPS: Dict[str, WageGroup] = {}
-EMPLOYEES: Dict[str, EmployeeDetails] = {}
-EMPLOYEE_NUMBERS = iter(range(1, 1000))
+WAGE_GROUPS_JSON: Dict[str, bytes] = {}
+EMPLOYEES: Dict[str, EmployeeRecord] = {}
+EMPLOYEES_JSON: Dict[str, bytes] = {}
+BY_PARTTIME_DAY: DefaultDict[Optional[WeekDay], Set[str]] = defaultdict(set)
+EMPLOYEES_BY_WAGEGROUP: DefaultDict[str, Set[str]] = defaultdict(set)
+EMPLOYEE_NUMBERS = count(1)
+EMPLOYEE_IDS = generate_ids()
 ENERGY_LABELS: Dict[str, Dict[int, Dict[str, EnergyLabel]]] = {
     "1111AA": {
         10: {
@@ -100,16 +154,57 @@ ENERGY_LABELS: Dict[str, Dict[int, Dict[str, EnergyLabel]]] = {
         },
     }
 }
+ENERGY_LABELS_JSON: Dict[Tuple[str, int, str], bytes] = {
+    (zipcode, home_number, extension): orjson.dumps({"message": label})
+    for zipcode, labels_for_zipcode in ENERGY_LABELS.items()
+    for home_number, labels_for_home_number in labels_for_zipcode.items()
+    for extension, label in labels_for_home_number.items()
+}
+NO_ENERGY_LABEL_JSON = orjson.dumps({"message": EnergyLabel.X})
 EVENTS: List[Event] = [
     Event(message=Message(message="Hello?"), details=[Detail(detail="First post")]),
     Event(message=Message(message="First!"), details=[Detail(detail="Second post")]),
 ]
 
 
+# Static responses are rendered once and reused.
+WELCOME_STRANGER = ORJSONResponse(content={"message": "Welcome stranger!"})
+SEAL_NOT_REMOVED = ORJSONResponse(
+    content={"detail": "Seal was not removed!"}, status_code=403
+)
+WAGE_GROUP_NOT_FOUND = ORJSONResponse(
+    content={"detail": "Wage group not found."}, status_code=404
+)
+# get_wagegroup has always reported the missing wage group without a full stop.
+GET_WAGE_GROUP_NOT_FOUND = ORJSONResponse(
+    content={"detail": "Wage group not found"}, status_code=404
+)
+WAGE_GROUP_EXISTS = ORJSONResponse(
+    content={"detail": "Wage group already exists."}, status_code=418
+)
+INVALID_HOURLY_RATE = ORJSONResponse(
+    content={"detail": "Hourly rates must end with .99 for psychological reasons."},
+    status_code=422,
+)
+OVERTIME_DEPRECATED = ORJSONResponse(
+    content={"detail": "Overtime percentage is deprecated."}, status_code=422
+)
+EMPLOYEE_TOO_YOUNG = ORJSONResponse(
+    content={"detail": "An employee must be at least 18 years old."}, status_code=403
+)
+EMPLOYEE_NOT_FOUND = ORJSONResponse(
+    content={"detail": "Employee not found"}, status_code=404
+)
+
+
 @app.get("/", status_code=200, response_model=Message)
-def get_root(*, name_from_header: str = Header(""), title: str = Header("")) -> Message:
+async def get_root(
+    *, name_from_header: str = Header(""), title: str = Header("")
+) -> Response:
+    if not name_from_header and not title:
+        return WELCOME_STRANGER
     name = name_from_header if name_from_header else "stranger"
-    return Message(message=f"Welcome {title}{name}!")
+    return ORJSONResponse(content={"message": f"Welcome {title}{name}!"})
 
 
 @app.get(
@@ -118,21 +213,21 @@ def get_root(*, name_from_header: str = Header(""), title: str = Header("")) ->
     response_model=Message,
     responses={401: {"model": Detail}, 403: {"model": Detail}},
 )
-def get_message(
+async def get_message(
     *, secret_code: int = Header(...), seal: str = Header(REMOVE_ME)
-) -> Message:
+) -> Response:
     if secret_code != 42:
         raise HTTPException(
             status_code=401, detail=f"Provided code {secret_code} is incorrect!"
         )
     if seal is not REMOVE_ME:
-        raise HTTPException(status_code=403, detail="Seal was not removed!")
-    return Message(message="Welcome, agent HAL")
+        return SEAL_NOT_REMOVED
+    return ORJSONResponse(content={"message": "Welcome, agent HAL"})
 
 
 # deliberate trailing /
 @app.get("/events/", status_code=200, response_model=List[Event])
-def get_events(
+async def get_events(
     search_strings: Optional[List[str]] = Query(default=[]),
 ) -> List[Event]:
     if search_strings:
@@ -145,8 +240,8 @@ def get_events(
 
 # deliberate trailing /
 @app.post("/events/", status_code=201, response_model=Event)
-def post_event(event: Event) -> Event:
-    event.details.append(Detail(detail=str(datetime.datetime.now())))
+async def post_event(event: Event) -> Event:
+    event.details.append(Detail.model_construct(detail=str(datetime.datetime.now())))
     EVENTS.append(event)
     return event
 
@@ -156,17 +251,16 @@ def post_event(event: Event) -> Event:
     status_code=200,
     response_model=Message,
 )
-def get_energy_label(
+async def get_energy_label(
     zipcode: str = Path(..., min_length=6, max_length=6),
     home_number: int = Path(..., ge=1),
     extension: Optional[str] = Query(" ", min_length=1, max_length=9),
-) -> Message:
-    if not (labels_for_zipcode := ENERGY_LABELS.get(zipcode)):
-        return Message(message=EnergyLabel.X)
-    if not (labels_for_home_number := labels_for_zipcode.get(home_number)):
-        return Message(message=EnergyLabel.X)
+) -> Response:
     extension = "" if extension is None else extension.strip()
-    return Message(message=labels_for_home_number.get(extension, EnergyLabel.X))
+    label = ENERGY_LABELS_JSON.get(
+        (zipcode, home_number, extension), NO_ENERGY_LABEL_JSON
+    )
+    return Response(content=label, media_type="application/json")
 
 
 @app.post(
@@ -175,21 +269,21 @@ def get_energy_label(
     response_model=WageGroup,
     responses={418: {"model": Detail}, 422: {"model": Detail}},
 )
-def post_wagegroup(wagegroup: WageGroup) -> WageGroup:
+async def post_wagegroup(wagegroup: WageGroup) -> Response:
     if wagegroup.wagegroup_id in WAGE_GROUPS:
-        raise HTTPException(status_code=418, detail="Wage group already exists.")
+        return WAGE_GROUP_EXISTS
     if not (0.99 - DELTA) < (wagegroup.hourly_rate % 1) < (0.99 + DELTA):
-        raise HTTPException(
-            status_code=422,
-            detail="Hourly rates must end with .99 for psychological reasons.",
-        )
+        return INVALID_HOURLY_RATE
     if wagegroup.overtime_percentage != DEPRECATED:
-        raise HTTPException(
-            status_code=422, detail="Overtime percentage is deprecated."
-        )
+        return OVERTIME_DEPRECATED
     wagegroup.overtime_percentage = None
     WAGE_GROUPS[wagegroup.wagegroup_id] = wagegroup
-    return wagegroup
+    WAGE_GROUPS_JSON[wagegroup.wagegroup_id] = wagegroup_json = orjson.dumps(
+        wagegroup.model_dump(by_alias=True)
+    )
+    return Response(
+        content=wagegroup_json, status_code=201, media_type="application/json"
+    )
 
 
 @app.get(
@@ -198,10 +292,10 @@ def post_wagegroup(wagegroup: WageGroup) -> WageGroup:
     response_model=WageGroup,
     responses={404: {"model": Detail}},
 )
-def get_wagegroup(wagegroup_id: str) -> WageGroup:
-    if wagegroup_id not in WAGE_GROUPS:
-        raise HTTPException(status_code=404, detail="Wage group not found")
-    return WAGE_GROUPS[wagegroup_id]
+async def get_wagegroup(wagegroup_id: str) -> Response:
+    if (wagegroup_json := WAGE_GROUPS_JSON.get(wagegroup_id)) is None:
+        return GET_WAGE_GROUP_NOT_FOUND
+    return Response(content=wagegroup_json, media_type="application/json")
 
 
 @app.put(
@@ -210,23 +304,21 @@ def get_wagegroup(wagegroup_id: str) -> WageGroup:
     response_model=WageGroup,
     responses={404: {"model": Detail}, 418: {"model": Detail}, 422: {"model": Detail}},
 )
-def put_wagegroup(wagegroup_id: str, wagegroup: WageGroup) -> WageGroup:
+async def put_wagegroup(wagegroup_id: str, wagegroup: WageGroup) -> Response:
     if wagegroup_id not in WAGE_GROUPS:
-        raise HTTPException(status_code=404, detail="Wage group not found.")
+        return WAGE_GROUP_NOT_FOUND
     if wagegroup.wagegroup_id in WAGE_GROUPS:
-        raise HTTPException(status_code=418, detail="Wage group already exists.")
+        return WAGE_GROUP_EXISTS
     if not (0.99 - DELTA) < (wagegroup.hourly_rate % 1) < (0.99 + DELTA):
-        raise HTTPException(
-            status_code=422,
-            detail="Hourly rates must end with .99 for psychological reasons.",
-        )
+        return INVALID_HOURLY_RATE
     if wagegroup.overtime_percentage != DEPRECATED:
-        raise HTTPException(
-            status_code=422, detail="Overtime percentage is deprecated."
-        )
+        return OVERTIME_DEPRECATED
     wagegroup.overtime_percentage = None
     WAGE_GROUPS[wagegroup.wagegroup_id] = wagegroup
-    return wagegroup
+    WAGE_GROUPS_JSON[wagegroup.wagegroup_id] = wagegroup_json = orjson.dumps(
+        wagegroup.model_dump(by_alias=True)
+    )
+    return Response(content=wagegroup_json, media_type="application/json")
 
 
 @app.delete(
@@ -235,16 +327,17 @@ def put_wagegroup(wagegroup_id: str, wagegroup: WageGroup) -> WageGroup:
     response_class=Response,
     responses={404: {"model": Detail}, 406: {"model": Detail}},
 )
-def delete_wagegroup(wagegroup_id: str) -> None:
+async def delete_wagegroup(wagegroup_id: str) -> Response:
     if wagegroup_id not in WAGE_GROUPS:
-        raise HTTPException(status_code=404, detail="Wage group not found.")
-    used_by = [e for e in EMPLOYEES.values() if e.wagegroup_id == wagegroup_id]
-    if used_by:
+        return WAGE_GROUP_NOT_FOUND
+    if used_by := len(EMPLOYEES_BY_WAGEGROUP.get(wagegroup_id, ())):
         raise HTTPException(
             status_code=406,
-            detail=f"Wage group still in use by {len(used_by)} employees.",
+            detail=f"Wage group still in use by {used_by} employees.",
         )
     WAGE_GROUPS.pop(wagegroup_id)
+    WAGE_GROUPS_JSON.pop(wagegroup_id)
+    return Response(status_code=204)
 
 
 @app.get(
@@ -253,10 +346,14 @@ def delete_wagegroup(wagegroup_id: str) -> None:
     response_model=List[EmployeeDetails],
     responses={404: {"model": Detail}},
 )
-def get_employees_in_wagegroup(wagegroup_id: str) -> List[EmployeeDetails]:
+async def get_employees_in_wagegroup(wagegroup_id: str) -> Response:
     if wagegroup_id not in WAGE_GROUPS:
-        raise HTTPException(status_code=404, detail="Wage group not found.")
-    return [e for e in EMPLOYEES.values() if e.wagegroup_id == wagegroup_id]
+        return WAGE_GROUP_NOT_FOUND
+    return json_array_response(
+        EMPLOYEES_JSON[employee_id]
+        for employee_id, employee in EMPLOYEES.items()
+        if employee.wagegroup_id == wagegroup_id
+    )
 
 
 @app.post(
@@ -265,7 +362,7 @@ def get_employees_in_wagegroup(wagegroup_id: str) -> List[EmployeeDetails]:
     response_model=EmployeeDetails,
     responses={403: {"model": Detail}, 451: {"model": Detail}},
 )
-def post_employee(employee: Employee) -> EmployeeDetails:
+async def post_employee(employee: Employee) -> Response:
     wagegroup_id = employee.wagegroup_id
     if wagegroup_id not in WAGE_GROUPS:
         raise HTTPException(
@@ -274,16 +371,20 @@ def post_employee(employee: Employee) -> EmployeeDetails:
     today = datetime.date.today()
     employee_age = today - employee.date_of_birth
     if employee_age.days < 18 * 365:
-        raise HTTPException(
-            status_code=403, detail="An employee must be at least 18 years old."
-        )
-    new_employee = EmployeeDetails(
-        identification=uuid4().hex,
+        return EMPLOYEE_TOO_YOUNG
+    new_employee = EmployeeRecord(
+        identification=next(EMPLOYEE_IDS),
         employee_number=next(EMPLOYEE_NUMBERS),
-        **employee.dict(),
+        **employee.__dict__,
+    )
+    employee_id = new_employee.identification
+    EMPLOYEES[employee_id] = new_employee
+    EMPLOYEES_JSON[employee_id] = employee_json = orjson.dumps(new_employee)
+    BY_PARTTIME_DAY[new_employee.parttime_day].add(employee_id)
+    EMPLOYEES_BY_WAGEGROUP[wagegroup_id].add(employee_id)
+    return Response(
+        content=employee_json, status_code=201, media_type="application/json"
     )
-    EMPLOYEES[new_employee.identification] = new_employee
-    return new_employee
 
 
 @app.get(
@@ -291,8 +392,8 @@ def post_employee(employee: Employee) -> EmployeeDetails:
     status_code=200,
     response_model=List[EmployeeDetails],
 )
-def get_employees() -> List[EmployeeDetails]:
-    return list(EMPLOYEES.values())
+async def get_employees() -> Response:
+    return json_array_response(EMPLOYEES_JSON.values())
 
 
 @app.get(
@@ -301,10 +402,10 @@ def get_employees() -> List[EmployeeDetails]:
     response_model=EmployeeDetails,
     responses={404: {"model": Detail}},
 )
-def get_employee(employee_id: str) -> EmployeeDetails:
-    if employee_id not in EMPLOYEES:
-        raise HTTPException(status_code=404, detail="Employee not found")
-    return EMPLOYEES[employee_id]
+async def get_employee(employee_id: str) -> Response:
+    if (employee_json := EMPLOYEES_JSON.get(employee_id)) is None:
+        return EMPLOYEE_NOT_FOUND
+    return Response(content=employee_json, media_type="application/json")
 
 
 @app.patch(
@@ -313,13 +414,14 @@ def get_employee(employee_id: str) -> EmployeeDetails:
     response_model=EmployeeDetails,
     responses={404: {"model": Detail}},
 )
-def patch_employee(employee_id: str, employee: EmployeeUpdate) -> EmployeeDetails:
-    if employee_id not in EMPLOYEES.keys():
-        raise HTTPException(status_code=404, detail="Employee not found")
-    stored_employee_data = EMPLOYEES[employee_id]
-    employee_update_data = employee.model_dump(
-        exclude_defaults=True, exclude_unset=True
-    )
+async def patch_employee(employee_id: str, employee: EmployeeUpdate) -> Response:
+    if (stored_employee_data := EMPLOYEES.get(employee_id)) is None:
+        return EMPLOYEE_NOT_FOUND
+    employee_update_data = {
+        name: value
+        for name in employee.model_fields_set
+        if (value := getattr(employee, name)) is not None
+    }
 
     wagegroup_id = employee_update_data.get("wagegroup_id", None)
     if wagegroup_id and wagegroup_id not in WAGE_GROUPS:
@@ -331,17 +433,25 @@ def patch_employee(employee_id: str, employee: EmployeeUpdate) -> EmployeeDetail
     if date_of_birth := employee_update_data.get("date_of_birth", None):
         employee_age = today - date_of_birth
         if employee_age.days < 18 * 365:
-            raise HTTPException(
-                status_code=403, detail="An employee must be at least 18 years old."
-            )
+            return EMPLOYEE_TOO_YOUNG
 
-    updated_employee = stored_employee_data.model_copy(update=employee_update_data)
+    updated_employee = replace(stored_employee_data, **employee_update_data)
     EMPLOYEES[employee_id] = updated_employee
-    return updated_employee
+    EMPLOYEES_JSON[employee_id] = employee_json = orjson.dumps(updated_employee)
+    if updated_employee.parttime_day != stored_employee_data.parttime_day:
+        BY_PARTTIME_DAY[stored_employee_data.parttime_day].discard(employee_id)
+        BY_PARTTIME_DAY[updated_employee.parttime_day].add(employee_id)
+    if updated_employee.wagegroup_id != stored_employee_data.wagegroup_id:
+        EMPLOYEES_BY_WAGEGROUP[stored_employee_data.wagegroup_id].discard(employee_id)
+        EMPLOYEES_BY_WAGEGROUP[updated_employee.wagegroup_id].add(employee_id)
+    return Response(content=employee_json, media_type="application/json")
 
 
 @app.get("/available_employees", status_code=200, response_model=List[EmployeeDetails])
-def get_available_employees(weekday: WeekDay = Query(...)) -> List[EmployeeDetails]:
-    return [
-        e for e in EMPLOYEES.values() if getattr(e, "parttime_day", None) != weekday
-    ]
+async def get_available_employees(weekday: WeekDay = Query(...)) -> Response:
+    unavailable_employees = BY_PARTTIME_DAY.get(weekday, set())
+    return json_array_response(
+        employee_json
+        for employee_id, employee_json in EMPLOYEES_JSON.items()
+        if employee_id not in unavailable_employees
+    )
@@ -14,97 +14,102 @@ from OpenApiLibCore import (
 
 
 class WagegroupDto(Dto):
+    _RELATIONS: Tuple[Relation, ...] = (
+        UniquePropertyValueConstraint(
+            property_name="id",
+            value="Teapot",
+            error_code=418,
+        ),
+        IdReference(
+            property_name="wagegroup_id",
+            post_path="/employees",
+            error_code=406,
+        ),
+        PropertyValueConstraint(
+            property_name="overtime_percentage",
+            values=[IGNORE],
+            invalid_value=110,
+            invalid_value_error_code=422,
+        ),
+        PropertyValueConstraint(
+            property_name="hourly-rate",
+            values=[80.99, 90.99, 99.99],
+            error_code=400,
+        ),
+    )
+
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            UniquePropertyValueConstraint(
-                property_name="id",
-                value="Teapot",
-                error_code=418,
-            ),
-            IdReference(
-                property_name="wagegroup_id",
-                post_path="/employees",
-                error_code=406,
-            ),
-            PropertyValueConstraint(
-                property_name="overtime_percentage",
-                values=[IGNORE],
-                invalid_value=110,
-                invalid_value_error_code=422,
-            ),
-            PropertyValueConstraint(
-                property_name="hourly-rate",
-                values=[80.99, 90.99, 99.99],
-                error_code=400,
-            ),
-        ]
-        return relations
+        return list(WagegroupDto._RELATIONS)
 
 
 class WagegroupDeleteDto(Dto):
+    _RELATIONS: Tuple[Relation, ...] = (
+        UniquePropertyValueConstraint(
+            property_name="id",
+            value="Teapot",
+            error_code=418,
+        ),
+        IdReference(
+            property_name="wagegroup_id",
+            post_path="/employees",
+            error_code=406,
+        ),
+    )
+
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            UniquePropertyValueConstraint(
-                property_name="id",
-                value="Teapot",
-                error_code=418,
-            ),
-            IdReference(
-                property_name="wagegroup_id",
-                post_path="/employees",
-                error_code=406,
-            ),
-        ]
-        return relations
+        return list(WagegroupDeleteDto._RELATIONS)
 
 
 class EmployeeDto(Dto):
+    _RELATIONS: Tuple[Relation, ...] = (
+        IdDependency(
+            property_name="wagegroup_id",
+            get_path="/wagegroups",
+            error_code=451,
+        ),
+        PropertyValueConstraint(
+            property_name="date_of_birth",
+            values=["1970-07-07", "1980-08-08", "1990-09-09"],
+            invalid_value="2020-02-20",
+            invalid_value_error_code=403,
+            error_code=422,
+        ),
+    )
+
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            IdDependency(
-                property_name="wagegroup_id",
-                get_path="/wagegroups",
-                error_code=451,
-            ),
-            PropertyValueConstraint(
-                property_name="date_of_birth",
-                values=["1970-07-07", "1980-08-08", "1990-09-09"],
-                invalid_value="2020-02-20",
-                invalid_value_error_code=403,
-                error_code=422,
-            ),
-        ]
-        return relations
+        return list(EmployeeDto._RELATIONS)
 
 
 class EnergyLabelDto(Dto):
+    _RELATIONS: Tuple[Relation, ...] = (
+        PathPropertiesConstraint(path="/energy_label/1111AA/10"),
+    )
+
     @staticmethod
     def get_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            PathPropertiesConstraint(path="/energy_label/1111AA/10"),
-        ]
-        return relations
+        return list(EnergyLabelDto._RELATIONS)
 
 
 class MessageDto(Dto):
+    _RELATIONS: Tuple[Relation, ...] = (
+        PropertyValueConstraint(
+            property_name="secret-code",  # note: property name converted by FastAPI
+            values=[42],
+            error_code=401,
+        ),
+        PropertyValueConstraint(
+            property_name="seal",
+            values=[IGNORE],
+            error_code=403,
+        ),
+    )
+
     @staticmethod
     def get_parameter_relations() -> List[Relation]:
-        relations: List[Relation] = [
-            PropertyValueConstraint(
-                property_name="secret-code",  # note: property name converted by FastAPI
-                values=[42],
-                error_code=401,
-            ),
-            PropertyValueConstraint(
-                property_name="seal",
-                values=[IGNORE],
-                error_code=403,
-            ),
-        ]
-        return relations
+        return list(MessageDto._RELATIONS)
 
 
 DTO_MAPPING: Dict[Tuple[str, str], Type[Dto]] = {